@@ -5,12 +5,20 @@ Bridges Perplexity -> Gemini 2.0 -> Local Resources (ComfyUI, Vault, Models)
 """
 from fastmcp import FastMCP
 import os
-import requests
+import json
+import socket
 import sys
 from pathlib import Path
+from urllib.parse import urlsplit
 import shutil
 import subprocess
-from dotenv import load_dotenv
+import atexit
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import signal
+import threading
+import time
+from dotenv import dotenv_values, find_dotenv
+from dotenv.main import resolve_variables
 
 # 1. Load Environment Variables (API Key)
 # Load central vault keys first, then fall back to local .env
@@ -18,11 +26,137 @@ vault_env_candidates = [
     Path("/mnt/scratch/vault/central_keys.env"),
     Path("/mnt/scratch/vault/.gemini_env"),
 ]
-for env_path in vault_env_candidates:
-    if env_path.exists():
-        load_dotenv(dotenv_path=env_path, override=False)
 
-load_dotenv()
+
+# Merged .env values are cached as JSON and reused until a source file changes.
+# Set EVO_ENV_CACHE=0 to always parse the .env files directly.
+_ENV_CACHE_PATH = (
+    Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "evo" / "env.json"
+)
+
+
+def _read_env_sources() -> tuple[list, list]:
+    """Stat each .env source once; return its signature and raw per-file values.
+
+    Values are parsed without interpolation so the cache never freezes a
+    ${VAR} that was resolved against the environment of an earlier run.
+    """
+    sources = [*vault_env_candidates]
+    local_env = find_dotenv()
+    if local_env:
+        sources.append(Path(local_env))
+
+    signature = []
+    for env_path in sources:
+        try:
+            st = env_path.stat()
+        except OSError:
+            continue
+        signature.append([str(env_path), st.st_mtime_ns, st.st_size])
+
+    use_cache = os.getenv("EVO_ENV_CACHE", "1") != "0"
+    if use_cache:
+        try:
+            with open(_ENV_CACHE_PATH, "r", encoding="utf-8") as handle:
+                cached = json.load(handle)
+            files = cached.get("files")
+            if (
+                cached.get("sources") == signature
+                and isinstance(files, list)
+                and len(files) == len(signature)
+                and all(isinstance(values, dict) for values in files)
+            ):
+                return signature, files
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    files = [dotenv_values(env_path, interpolate=False) for env_path, _, _ in signature]
+
+    if use_cache:
+        try:
+            _ENV_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = _ENV_CACHE_PATH.with_suffix(".tmp")
+            # The cache holds API keys, so keep it private to the user
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump({"sources": signature, "files": files}, handle)
+            os.replace(tmp_path, _ENV_CACHE_PATH)
+        except OSError:
+            pass
+    return signature, files
+
+
+# Keys this module copied into os.environ from .env files, with their values
+_ENV_FILE_VALUES = {}
+
+
+def _load_env_files():
+    # Forget values from a previous load so reload_env() picks up edited files;
+    # keys changed by someone else since then are left alone.
+    for key, value in _ENV_FILE_VALUES.items():
+        if os.environ.get(key) == value:
+            del os.environ[key]
+    _ENV_FILE_VALUES.clear()
+
+    # Same result as calling load_dotenv(override=False) on each file in order:
+    # ${VAR} resolves against os.environ (including keys set by earlier files)
+    # and variables already in the process environment take precedence.
+    _, files = _read_env_sources()
+    for raw_values in files:
+        for key, value in resolve_variables(raw_values.items(), override=False).items():
+            if value is not None and key not in os.environ:
+                os.environ[key] = value
+                _ENV_FILE_VALUES[key] = value
+
+
+def _parse_comfy_addr(comfy_url: str) -> tuple:
+    """Return the (host, port) to probe for ComfyUI; ValueError if the URL is unusable."""
+    url = urlsplit(comfy_url)
+    if url.scheme not in ("http", "https") or not url.hostname:
+        raise ValueError(f"expected http://host:port, got {comfy_url!r}")
+    # url.port itself raises ValueError for a non-numeric or out-of-range port
+    return (url.hostname, url.port or (443 if url.scheme == "https" else 80))
+
+
+def _snapshot_env():
+    """Copy the settings we need out of os.environ so hot paths never read it."""
+    global _GEMINI_API_KEY, _COMFYUI_URL, _COMFYUI_ADDR, _COMFYUI_ADDR_ERROR, _MODELS_DIR, _GPU_CACHE_TTL, _GPU_POLL_INTERVAL
+    global _MCP_TRANSPORT, _MCP_HOST, _MCP_PORT
+    _GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+    _COMFYUI_URL = os.getenv("COMFYUI_URL", "http://127.0.0.1:8188")
+    try:
+        _COMFYUI_ADDR = _parse_comfy_addr(_COMFYUI_URL)
+        _COMFYUI_ADDR_ERROR = None
+    except ValueError as e:
+        # Don't guess an address; generate_image reports the error instead
+        _COMFYUI_ADDR = None
+        _COMFYUI_ADDR_ERROR = f"Invalid COMFYUI_URL: {e}"
+        sys.stderr.write(f"{_COMFYUI_ADDR_ERROR}\n")
+    _MODELS_DIR = os.getenv("MODELS_DIR", "/mnt/scratch/models/GGUF")
+    _GPU_CACHE_TTL = float(os.getenv("EVO_GPU_CACHE_TTL", "2"))
+    # Floor of 100 ms so the GPU monitor always sleeps between samples
+    _GPU_POLL_INTERVAL = max(float(os.getenv("EVO_GPU_POLL_INTERVAL", "1")), 0.1)
+    # "stdio" (default) or a persistent transport such as "sse" / "http"
+    _MCP_TRANSPORT = os.getenv("EVO_MCP_TRANSPORT", "stdio")
+    _MCP_HOST = os.getenv("EVO_MCP_HOST", "127.0.0.1")
+    _MCP_PORT = int(os.getenv("EVO_MCP_PORT", "8765"))
+
+
+def reload_env():
+    """Re-read .env files and refresh the cached settings.
+
+    Keys loaded from .env files are replaced with their current file values;
+    variables set in the process environment still take precedence.
+    """
+    global _genai_model
+    _load_env_files()
+    _snapshot_env()
+    # Force the Gemini client to pick up a possibly changed API key
+    _genai_model = None
+
+
+_load_env_files()
+_snapshot_env()
 
 # 2. Configure Gemini (lazy init to keep MCP startup fast)
 _genai_model = None
@@ -33,21 +167,56 @@ def _get_genai_model():
     if _genai_model is not None:
         return _genai_model
 
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key:
+    if not _GEMINI_API_KEY:
         raise ValueError("❌ GEMINI_API_KEY not found in .env file! Please create it.")
 
     import google.generativeai as genai
 
-    genai.configure(api_key=api_key)
+    genai.configure(api_key=_GEMINI_API_KEY)
     _genai_model = genai.GenerativeModel("gemini-2.0-flash-exp")
     return _genai_model
 
+# Worker pool for overlapping independent network calls inside a tool
+_EXEC = ThreadPoolExecutor(max_workers=4, thread_name_prefix="evo")
+
+# ComfyUI liveness is cached for _COMFY_STATUS_TTL seconds. The GPU monitor
+# thread keeps it fresh while it runs; otherwise a stale entry is re-probed
+# inline, which costs at most the 0.25s connect timeout.
+_COMFY_STATUS_TTL = 5.0
+# (timestamp, online) replaced as one tuple so threads never see a torn update
+_COMFY_STATUS = (0.0, False)
+
+
+def _probe_comfy() -> bool:
+    """TCP-connect to ComfyUI and record whether it is accepting connections."""
+    global _COMFY_STATUS
+    if _COMFYUI_ADDR is None:
+        return False
+    try:
+        with socket.create_connection(_COMFYUI_ADDR, timeout=0.25):
+            online = True
+    except OSError:
+        online = False
+    _COMFY_STATUS = (time.monotonic(), online)
+    return online
+
+
+def _comfy_online() -> bool:
+    checked_at, online = _COMFY_STATUS
+    if time.monotonic() - checked_at > _COMFY_STATUS_TTL:
+        return _probe_comfy()
+    return online
+
 # 3. Initialize MCP Server
 mcp = FastMCP("Evolution Studio")
 
 # ===== TOOLS =====
 
+def _stream_enhancement(model, prompt_text: str) -> str:
+    """Stream the Gemini response and join the chunks as they arrive."""
+    response = model.generate_content(prompt_text, stream=True)
+    return "".join(chunk.text for chunk in response)
+
 @mcp.tool()
 def generate_image(prompt: str, workflow: str = "flux_default") -> dict:
     """
@@ -56,23 +225,29 @@ def generate_image(prompt: str, workflow: str = "flux_default") -> dict:
         prompt: Description of the image to generate
         workflow: Workflow name (default: flux_default)
     """
+    if _COMFYUI_ADDR_ERROR:
+        return {"status": "error", "message": _COMFYUI_ADDR_ERROR}
+
     try:
-        # Step 1: Use Gemini to enhance the user's prompt for better results
+        # Step 1: Use Gemini to enhance the user's prompt for better results,
+        # checking ComfyUI liveness in parallel since the two are independent
         model = _get_genai_model()
-        enhanced_prompt = model.generate_content(
+        fut_probe = _EXEC.submit(_comfy_online)
+        fut_enh = _EXEC.submit(
+            _stream_enhancement,
+            model,
             f"Convert this raw idea into a high-quality Stable Diffusion prompt. Keep it under 200 words. Raw idea: {prompt}"
-        ).text
+        )
+        enhanced_prompt = fut_enh.result()
 
         # Step 2: Send to Local ComfyUI (Simulated for connection test)
         # In production, this would send a full JSON workflow to port 8188
         print(f"🌊 Sending to ComfyUI: {enhanced_prompt}")
 
-        # Check if ComfyUI is actually running
-        try:
-            # Simple ping to see if server is up
-            requests.get("http://127.0.0.1:8188", timeout=2)
+        # Check if ComfyUI is actually running (cached liveness probe)
+        if fut_probe.result():
             status = "ComfyUI is ONLINE"
-        except requests.exceptions.ConnectionError:
+        else:
             status = "ComfyUI is OFFLINE (Start it to generate real images)"
 
         return {
@@ -84,14 +259,32 @@ def generate_image(prompt: str, workflow: str = "flux_default") -> dict:
     except Exception as e:
         return {"status": "error", "message": str(e)}
 
+# (path, mtime_ns, names) of the last scan; replaced as one tuple so
+# concurrent callers never see a path paired with another directory's list
+_MODELS_CACHE = None
+
 @mcp.tool()
 def list_models() -> dict:
     """List available AI models from the S: drive /mnt/scratch/models/"""
-    path = Path("/mnt/scratch/models/GGUF")
-    if path.exists():
-        models = [f.name for f in path.iterdir() if f.is_file()]
-        return {"category": "GGUF", "models": models, "count": len(models)}
-    return {"status": "empty", "message": "No GGUF models found in /mnt/scratch/models/GGUF"}
+    global _MODELS_CACHE
+    models_dir = _MODELS_DIR
+    try:
+        mtime_ns = os.stat(models_dir).st_mtime_ns
+    except OSError:
+        _MODELS_CACHE = None
+        return {"status": "empty", "message": f"No GGUF models found in {models_dir}"}
+
+    # The directory mtime only changes when entries are added/removed/renamed
+    cached = _MODELS_CACHE
+    if cached is not None and cached[:2] == (models_dir, mtime_ns):
+        names = cached[2]
+    else:
+        with os.scandir(models_dir) as entries:
+            names = [entry.name for entry in entries if entry.is_file()]
+        _MODELS_CACHE = (models_dir, mtime_ns, names)
+
+    models = list(names)
+    return {"category": "GGUF", "models": models, "count": len(models)}
 
 @mcp.tool()
 def list_workflows() -> dict:
@@ -197,29 +390,380 @@ def query_vault(query: str, max_results: int = 20) -> dict:
         return {"status": "empty", "count": 0, "matches": []}
     return {"count": len(matches), "matches": matches}
 
-@mcp.tool()
-def gpu_status() -> dict:
-    """Check RTX 3060 VRAM usage via nvidia-smi"""
+# pynvml is imported and NVML initialised on first use (avoids spawning
+# nvidia-smi per call without adding to server cold start)
+pynvml = None
+_PYNVML_CHECKED = False
+_NVML_LOCK = threading.Lock()
+_NVML_READY = False
+_NVML_FAILED = False
+_NVML_HANDLE = None
+
+# Short-lived cache so bursts of gpu_status calls share one read (TTL: _GPU_CACHE_TTL).
+# (timestamp, stats) replaced as one tuple so threads never see a torn update
+_GPU_CACHE = (0.0, None)
+
+# Background GPU monitor (started with the server) keeps the latest sample here
+_GPU_STATS_LOCK = threading.Lock()
+_LATEST_GPU_STATS = {}
+_MEMMON_STOP = threading.Event()
+_MEMMON_THREAD = None
+_SMI_PROC = None
+# GPU 0 only, matching the NVML handle; several GPUs would print several lines
+_SMI_QUERY = ['nvidia-smi', '--query-gpu=memory.used,memory.total,utilization.gpu', '--format=csv,noheader,nounits', '-i', '0']
+
+
+def _get_pynvml():
+    """Import pynvml on first use; returns None if it is not installed."""
+    global pynvml, _PYNVML_CHECKED
+    if _PYNVML_CHECKED:
+        return pynvml
+
+    try:
+        import pynvml as _pynvml
+        pynvml = _pynvml
+    except ImportError:
+        pynvml = None
+    _PYNVML_CHECKED = True
+    return pynvml
+
+
+def _nvml_usable() -> bool:
+    """True unless pynvml is missing or NVML already failed to initialise."""
+    return not _NVML_FAILED and _get_pynvml() is not None
+
+
+def _get_nvml_handle():
+    global _NVML_READY, _NVML_FAILED, _NVML_HANDLE
+    if _NVML_READY:
+        return _NVML_HANDLE
+
+    with _NVML_LOCK:
+        if not _NVML_READY:
+            try:
+                pynvml.nvmlInit()
+                atexit.register(pynvml.nvmlShutdown)
+                _NVML_HANDLE = pynvml.nvmlDeviceGetHandleByIndex(0)
+            except Exception:
+                # Don't retry nvmlInit on every call; use nvidia-smi instead
+                _NVML_FAILED = True
+                raise
+            _NVML_READY = True
+    return _NVML_HANDLE
+
+
+def _read_nvml_stats() -> dict:
+    handle = _get_nvml_handle()
+    mem = pynvml.nvmlDeviceGetMemoryInfo(handle)
+    util = pynvml.nvmlDeviceGetUtilizationRates(handle)
+    return {
+        "vram_used": f"{mem.used // 1024**2} MB",
+        "vram_total": f"{mem.total // 1024**2} MB",
+        "gpu_utilization": f"{util.gpu} %"
+    }
+
+
+def _publish_gpu_stats(stats: dict):
+    with _GPU_STATS_LOCK:
+        _LATEST_GPU_STATS.clear()
+        _LATEST_GPU_STATS.update(stats)
+    # Keep the ComfyUI liveness cache warm off the request path
+    _comfy_online()
+
+
+def _memmon_loop():
+    """Sample GPU stats (and refresh ComfyUI liveness) until _MEMMON_STOP is set."""
+    # pynvml import and NVML init happen here so they never delay startup
+    if _nvml_usable():
+        try:
+            _get_nvml_handle()
+        except Exception as e:
+            sys.stderr.write(f"NVML unavailable, using nvidia-smi: {e}\n")
+        else:
+            # Registered after nvmlInit so atexit stops the thread before nvmlShutdown
+            atexit.register(_stop_memmon)
+            _nvml_poll_loop()
+            return
+    _smi_stream_loop()
+
+
+def _nvml_poll_loop():
+    while not _MEMMON_STOP.is_set():
+        try:
+            stats = _read_nvml_stats()
+        except Exception as e:
+            stats = {"status": "error", "message": str(e)}
+        _publish_gpu_stats(stats)
+        # Sleep between samples so polling never busy-spins
+        _MEMMON_STOP.wait(_GPU_POLL_INTERVAL)
+
+
+def _smi_stream_loop():
+    """Fallback monitor: one long-lived nvidia-smi that prints a line per sample."""
+    global _SMI_PROC
+    try:
+        _SMI_PROC = subprocess.Popen(
+            [*_SMI_QUERY, '-lms', str(int(_GPU_POLL_INTERVAL * 1000))],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+    except OSError as e:
+        sys.stderr.write(f"GPU monitor disabled: {e}\n")
+        return
+
+    atexit.register(_stop_memmon)
+    for line in _SMI_PROC.stdout:
+        if _MEMMON_STOP.is_set():
+            break
+        stats = _parse_smi_line(line)
+        if stats is not None:
+            _publish_gpu_stats(stats)
+    # nvidia-smi exited (or we are stopping); gpu_status reads on demand again
+    with _GPU_STATS_LOCK:
+        _LATEST_GPU_STATS.clear()
+
+
+def _stop_memmon():
+    _MEMMON_STOP.set()
+    if _SMI_PROC is not None and _SMI_PROC.poll() is None:
+        _SMI_PROC.terminate()
+    if _MEMMON_THREAD is not None:
+        _MEMMON_THREAD.join(timeout=_GPU_POLL_INTERVAL + 1)
+
+
+def _start_memmon():
+    """Start the background GPU monitor (it exits quietly if no GPU source works)."""
+    global _MEMMON_THREAD
+    if _MEMMON_THREAD is not None:
+        return
+    _MEMMON_THREAD = threading.Thread(target=_memmon_loop, name="gpu-memmon", daemon=True)
+    _MEMMON_THREAD.start()
+
+
+def _handle_sigterm(signum, frame):
+    # Stop the monitor (and any nvidia-smi child), then let the default action
+    # terminate the process. Raising SystemExit here would make FastMCP wait on
+    # its stdin reader thread and hang under the stdio transport.
+    _MEMMON_STOP.set()
+    if _SMI_PROC is not None and _SMI_PROC.poll() is None:
+        _SMI_PROC.terminate()
+    signal.signal(signum, signal.SIG_DFL)
+    os.kill(os.getpid(), signum)
+
+
+def _parse_smi_line(line: str):
+    parts = [part.strip() for part in line.split(',')]
+    if len(parts) != 3 or not all(parts):
+        return None
+    used, total, util = parts
+    return {
+        "vram_used": f"{used} MB",
+        "vram_total": f"{total} MB",
+        "gpu_utilization": f"{util} %"
+    }
+
+
+def _gpu_status_smi() -> dict:
+    """Fallback: read GPU stats by spawning nvidia-smi."""
     try:
         result = subprocess.run(
-            ['nvidia-smi', '--query-gpu=memory.used,memory.total,utilization.gpu', '--format=csv,noheader,nounits'],
+            _SMI_QUERY,
             capture_output=True,
             text=True,
             timeout=5
         )
 
         if result.returncode == 0:
-            used, total, util = result.stdout.strip().split(',')
-            return {
-                "vram_used": f"{used} MB",
-                "vram_total": f"{total} MB",
-                "gpu_utilization": f"{util} %"
-            }
+            stats = _parse_smi_line(result.stdout.strip())
+            if stats is not None:
+                return stats
         return {"status": "error", "message": "Could not read GPU stats"}
     except Exception as e:
         return {"status": "error", "message": str(e)}
 
+@mcp.tool()
+def gpu_status() -> dict:
+    """Check RTX 3060 VRAM usage via NVML (falls back to nvidia-smi)"""
+    global _GPU_CACHE
+    # Fast path: the background monitor already has a fresh sample
+    with _GPU_STATS_LOCK:
+        if _LATEST_GPU_STATS:
+            return dict(_LATEST_GPU_STATS)
+
+    now = time.monotonic()
+    cached_at, cached = _GPU_CACHE
+    if cached is not None and now - cached_at < _GPU_CACHE_TTL:
+        return dict(cached)
+
+    response = None
+    if _nvml_usable():
+        try:
+            response = _read_nvml_stats()
+        except Exception as e:
+            if not _NVML_FAILED:
+                return {"status": "error", "message": str(e)}
+    if response is None:
+        response = _gpu_status_smi()
+
+    # Only cache successful reads so a transient failure is retried next call
+    if response.get("status") != "error":
+        _GPU_CACHE = (now, dict(response))
+    return response
+
+# Tools callable through batch_execute. FastMCP may wrap decorated functions
+# in Tool objects, so unwrap to the plain callable where needed.
+_TOOLS = {
+    name: getattr(tool, "fn", tool)
+    for name, tool in {
+        "generate_image": generate_image,
+        "list_models": list_models,
+        "list_workflows": list_workflows,
+        "query_vault": query_vault,
+        "gpu_status": gpu_status,
+    }.items()
+}
+
+
+def _run_tool_call(call: dict) -> dict:
+    name = call.get("name")
+    func = _TOOLS.get(name)
+    if func is None:
+        return {"status": "error", "message": f"Unknown tool: {name}"}
+    result = func(**(call.get("arguments") or {}))
+    if isinstance(result, dict) and result.get("status") == "error":
+        return result
+    return {"status": "success", "result": result}
+
+# Shared pool for batch_execute. Each batch keeps at most max_concurrent calls
+# submitted at once, and calls abandoned at a deadline can never hold more
+# than _BATCH_MAX_CONCURRENT threads in total.
+_BATCH_MAX_CONCURRENT = 16
+_BATCH_EXEC = ThreadPoolExecutor(max_workers=_BATCH_MAX_CONCURRENT, thread_name_prefix="evo-batch")
+
+
+def _future_result(future) -> dict:
+    try:
+        return future.result()
+    except Exception as e:
+        return {"status": "error", "message": str(e)}
+
+@mcp.tool()
+def batch_execute(
+    calls: list[dict],
+    max_concurrent: int = 4,
+    stop_on_error: bool = False,
+    timeout_ms: int = 30000,
+) -> dict:
+    """
+    Run several tool calls in parallel and return all results in one response.
+    Calls still running at the deadline (or when stop_on_error ends the batch)
+    are abandoned, not stopped: they finish in the background and their
+    results are discarded.
+    Args:
+        calls: List of {"name": <tool name>, "arguments": {...}}
+        max_concurrent: Maximum number of calls running at once (capped at 16)
+        stop_on_error: Skip calls that have not started once any call fails
+        timeout_ms: Overall deadline for the whole batch in milliseconds
+    """
+    if not calls:
+        return {"status": "error", "message": "No calls provided"}
+    if max_concurrent < 1:
+        return {"status": "error", "message": "max_concurrent must be at least 1"}
+    if timeout_ms < 1:
+        return {"status": "error", "message": "timeout_ms must be at least 1"}
+
+    workers = min(max_concurrent, _BATCH_MAX_CONCURRENT)
+    deadline = time.monotonic() + timeout_ms / 1000
+    results = [None] * len(calls)
+    queued = iter(range(len(calls)))
+    in_flight = {}
+    stopped_on_error = False
+
+    def submit_next():
+        idx = next(queued, None)
+        if idx is not None:
+            in_flight[_BATCH_EXEC.submit(_run_tool_call, calls[idx])] = idx
+
+    for _ in range(workers):
+        submit_next()
+
+    while in_flight and not stopped_on_error:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        done, _ = wait(in_flight, timeout=remaining, return_when=FIRST_COMPLETED)
+        for future in done:
+            idx = in_flight.pop(future)
+            results[idx] = _future_result(future)
+            if stop_on_error and results[idx]["status"] == "error":
+                stopped_on_error = True
+            else:
+                submit_next()
+
+    # Anything left either never started or overran the deadline / batch stop
+    for future, idx in in_flight.items():
+        if future.cancel():
+            results[idx] = None
+        elif future.done():
+            results[idx] = _future_result(future)
+        elif stopped_on_error:
+            results[idx] = {"status": "aborted", "message": "Still running when the batch stopped after an earlier error"}
+        else:
+            results[idx] = {"status": "error", "message": f"Timed out after {timeout_ms} ms"}
+
+    for idx, result in enumerate(results):
+        if result is not None:
+            continue
+        if stopped_on_error:
+            results[idx] = {"status": "cancelled", "message": "Skipped after an earlier error"}
+        else:
+            results[idx] = {"status": "error", "message": f"Not started before the {timeout_ms} ms deadline"}
+
+    for idx, call in enumerate(calls):
+        results[idx] = {"name": call.get("name"), **results[idx]}
+    return {"count": len(results), "results": results}
+
+# ===== REST BRIDGE =====
+# Plain HTTP access to the same tools for clients that don't speak MCP.
+# Only served when running with a network transport (EVO_MCP_TRANSPORT).
+
+@mcp.custom_route("/tools", methods=["GET"])
+async def rest_list_tools(request):
+    from starlette.responses import JSONResponse
+
+    return JSONResponse({"tools": sorted(_TOOLS)})
+
+@mcp.custom_route("/tools/{name}", methods=["POST"])
+async def rest_call_tool(request):
+    from starlette.concurrency import run_in_threadpool
+    from starlette.responses import JSONResponse
+
+    name = request.path_params["name"]
+    if name not in _TOOLS:
+        return JSONResponse({"status": "error", "message": f"Unknown tool: {name}"}, status_code=404)
+    try:
+        arguments = await request.json() if await request.body() else {}
+    except ValueError:
+        return JSONResponse({"status": "error", "message": "Body must be a JSON object"}, status_code=400)
+    if not isinstance(arguments, dict):
+        return JSONResponse({"status": "error", "message": "Body must be a JSON object"}, status_code=400)
+
+    try:
+        result = await run_in_threadpool(_run_tool_call, {"name": name, "arguments": arguments})
+    except Exception as e:
+        result = {"status": "error", "message": str(e)}
+    return JSONResponse(result)
+
 if __name__ == "__main__":
     sys.stderr.write("Evolution Studio MCP is running...\n")
     sys.stderr.flush()
-    mcp.run()
+    signal.signal(signal.SIGTERM, _handle_sigterm)
+    _start_memmon()
+    # Warm the model listing cache off the main thread
+    _EXEC.submit(_TOOLS["list_models"])
+    if _MCP_TRANSPORT == "stdio":
+        mcp.run()
+    else:
+        sys.stderr.write(f"Serving MCP over {_MCP_TRANSPORT} on {_MCP_HOST}:{_MCP_PORT}\n")
+        mcp.run(transport=_MCP_TRANSPORT, host=_MCP_HOST, port=_MCP_PORT)
@@ -2,6 +2,7 @@
 """Proper MCP stdio protocol test."""
 
 import json
+import os
 import select
 import subprocess
 import time
@@ -12,19 +13,72 @@ except Exception:
     mcp_types = None
 
 
+# Bytes read from the server's stdout that don't yet form a complete line
+_stdout_buffer = bytearray()
+
+
+def read_message(server, deadline):
+    """Read the next JSON-RPC message from the server before the deadline."""
+    fd = server.stdout.fileno()
+    while True:
+        newline = _stdout_buffer.find(b"\n")
+        if newline != -1:
+            line = bytes(_stdout_buffer[:newline])
+            del _stdout_buffer[: newline + 1]
+            if line.strip():
+                return json.loads(line)
+            continue
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError("Timed out waiting for a server response")
+        ready, _, _ = select.select([fd], [], [], remaining)
+        if not ready:
+            continue
+        try:
+            chunk = os.read(fd, 65536)
+        except BlockingIOError:
+            continue
+        if not chunk:
+            err = server.stderr.read()
+            raise RuntimeError(f"Server exited early. Stderr:\n{err}")
+        _stdout_buffer.extend(chunk)
+
+
 def send_request(server, request, timeout=15):
-    """Send a JSON-RPC request and read a single-line response with timeout."""
+    """Send a JSON-RPC request and wait for the response with the same id."""
     request_str = json.dumps(request) + "\n"
     server.stdin.write(request_str)
     server.stdin.flush()
-    ready, _, _ = select.select([server.stdout], [], [], timeout)
-    if not ready:
-        if server.poll() is not None:
-            err = server.stderr.read()
-            raise RuntimeError(f"Server exited early. Stderr:\n{err}")
+    deadline = time.monotonic() + timeout
+    try:
+        while True:
+            response = read_message(server, deadline)
+            if response.get("id") == request.get("id"):
+                return response
+    except TimeoutError:
         raise TimeoutError(f"No response after {timeout}s for {request.get('method')}")
-    response_str = server.stdout.readline()
-    return json.loads(response_str) if response_str else None
+
+
+def send_requests(server, requests, timeout=15):
+    """Write all requests back-to-back, then collect the responses by id."""
+    for request in requests:
+        server.stdin.write(json.dumps(request) + "\n")
+    server.stdin.flush()
+
+    pending = {request["id"] for request in requests}
+    responses = {}
+    deadline = time.monotonic() + timeout
+    try:
+        while pending:
+            response = read_message(server, deadline)
+            response_id = response.get("id")
+            if response_id in pending:
+                pending.discard(response_id)
+                responses[response_id] = response
+    except TimeoutError:
+        raise TimeoutError(f"No response after {timeout}s for request ids {sorted(pending)}")
+    return responses
 
 
 def send_notification(server, notification):
@@ -44,6 +98,8 @@ def main():
         text=True,
         bufsize=1,
     )
+    # stdout is read with os.read so a partial line can never block us
+    os.set_blocking(server.stdout.fileno(), False)
 
     try:
         print("Testing Evolution Studio MCP Server")
@@ -66,15 +122,13 @@ def main():
         send_notification(server, {"jsonrpc": "2.0", "method": "initialized", "params": {}})
         time.sleep(0.1)
 
+        # Tests are pipelined: send every request, then match responses by id
         # Test 1: List tools
         tools_request = {
             "jsonrpc": "2.0",
             "id": 1,
             "method": "tools/list",
         }
-        response = send_request(server, tools_request)
-        tools = response.get("result", {}).get("tools", []) if response else []
-        print(f"Found {len(tools)} tools")
 
         # Test 2: Call list_models
         call_request = {
@@ -86,8 +140,6 @@ def main():
                 "arguments": {},
             },
         }
-        response = send_request(server, call_request)
-        print(f"list_models result: {response.get('result', {}) if response else {}}")
 
         # Test 3: GPU Status
         gpu_request = {
@@ -99,8 +151,36 @@ def main():
                 "arguments": {},
             },
         }
-        response = send_request(server, gpu_request)
-        print(f"gpu_status result: {response.get('result', {}) if response else {}}")
+
+        # Test 4: batch_execute runs several tool calls in one round trip
+        batch_request = {
+            "jsonrpc": "2.0",
+            "id": 4,
+            "method": "tools/call",
+            "params": {
+                "name": "batch_execute",
+                "arguments": {
+                    "calls": [
+                        {"name": "list_models", "arguments": {}},
+                        {"name": "gpu_status", "arguments": {}},
+                    ],
+                },
+            },
+        }
+
+        responses = send_requests(
+            server, [tools_request, call_request, gpu_request, batch_request]
+        )
+
+        tools = responses[1].get("result", {}).get("tools", [])
+        print(f"Found {len(tools)} tools")
+        print(f"list_models result: {responses[2].get('result', {})}")
+        print(f"gpu_status result: {responses[3].get('result', {})}")
+
+        batch = responses[4].get("result", {})
+        if batch.get("isError") or "error" in responses[4]:
+            raise RuntimeError(f"batch_execute failed: {responses[4]}")
+        print(f"batch_execute result: {batch}")
 
         print("All tests completed")
     finally: